@@ -5,6 +5,7 @@ import functools
 import inspect
 import logging
 import socket
+import sys
 import time
 from collections import namedtuple
 from contextlib import AsyncExitStack
@@ -61,7 +62,8 @@ for source, code in INPUT_SOURCES_20_MINUTES_LR.items():
 
 INPUT_SOURCES_RESPONSE = {}
 for source, mapping in INPUT_SOURCES.items():
-    source = source.replace("_paired", "")
+    # Intern so "Bluetooth_paired" reports the same string object as "Bluetooth"
+    source = sys.intern(source.replace("_paired", ""))
     for t, (LR, RL) in mapping.items():
         INPUT_SOURCES_RESPONSE[LR] = (source, t, "L/R")
         INPUT_SOURCES_RESPONSE[RL] = (source, t, "R/L")
@@ -489,7 +491,11 @@ class AsyncKefSpeaker:
         return State(source, is_on, standby_time, orientation)
         
     async def get_full_status(self):
-        """Fetch volume, mute, source, power, and (optionally) playback state."""
+        """Fetch volume, mute, source, power, and (optionally) playback state.
+
+        Raises `ConnectionRefusedError` straight away when the speaker is
+        offline, instead of going through the retries of every getter."""
+        await self._comm.open_connection()
         volume, is_muted = await self.get_volume_and_is_muted()
         state = await self.get_state()
 
@@ -654,8 +660,8 @@ class AsyncKefSpeaker:
         high_pass=None,
         sub_polarity=None,
         bass_extension=None,
-    ) -> None:
-        """Set the mode of the speaker.
+    ) -> Mode:
+        """Set the mode of the speaker and return the mode that was sent.
 
         Leave option None to keep the setting the same."""
         current_mode = await self.get_mode()
@@ -683,6 +689,7 @@ class AsyncKefSpeaker:
         )
         await self._set_mode(new_mode)
         # XXX: implement a check like in set_source
+        return new_mode
 
     @retry(**_CMD_RETRY_KWARGS)
     async def _get_dsp(self, which) -> Union[int, str]:
@@ -0,0 +1,71 @@
+"""Data update coordinator for the KEF Wireless Speakers."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+from typing import Any
+
+from tenacity import RetryError
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .aiokef import AsyncKefSpeaker
+
+_LOGGER = logging.getLogger(__name__)
+
+SCAN_INTERVAL = timedelta(seconds=15)
+# Once the speaker has been seen off this many polls in a row, only poll
+# every OFF_SCAN_INTERVAL until a control call wakes the polling up again.
+OFF_POLLS_BEFORE_BACKOFF = 3
+OFF_SCAN_INTERVAL = timedelta(seconds=60)
+# Keep the refresh after a control call from being held back for long
+REQUEST_REFRESH_COOLDOWN = 1.0  # in seconds
+
+
+class KefDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Poll the status of a single KEF speaker."""
+
+    def __init__(
+        self, hass: HomeAssistant, speaker: AsyncKefSpeaker, name: str
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=None,  # YAML-only platform
+            name=name,
+            update_interval=SCAN_INTERVAL,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=True
+            ),
+        )
+        self.speaker = speaker
+        self._off_polls = 0
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch volume, source, power and play state from the speaker."""
+        try:
+            status = await self.speaker.get_full_status()
+        except (ConnectionError, TimeoutError, RetryError, OSError) as err:
+            # Anything ugly from aiokef / tenacity → just mark it unavailable
+            raise UpdateFailed(f"Error talking to {self.speaker.host}: {err}") from err
+
+        if status["is_on"]:
+            self._off_polls = 0
+        else:
+            self._off_polls += 1
+        self.update_interval = (
+            OFF_SCAN_INTERVAL
+            if self._off_polls > OFF_POLLS_BEFORE_BACKOFF
+            else SCAN_INTERVAL
+        )
+        return status
+
+    async def async_wake(self) -> None:
+        """Return to the normal poll rate and refresh after a control call."""
+        self._off_polls = 0
+        self.update_interval = SCAN_INTERVAL
+        await self.async_request_refresh()
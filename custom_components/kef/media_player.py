@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from functools import partial
 import logging
 
-from .aiokef import AsyncKefSpeaker
+from .aiokef import DSP_OPTION_MAPPING, AsyncKefSpeaker
+from .coordinator import KefDataUpdateCoordinator
 import voluptuous as vol
 
-from tenacity import RetryError
-
 from homeassistant.components.media_player import (
     PLATFORM_SCHEMA as MEDIA_PLAYER_PLATFORM_SCHEMA,
     MediaPlayerEntity,
@@ -17,10 +17,11 @@ from homeassistant.components.media_player import (
     MediaPlayerState,
 )
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT, CONF_TYPE, CONF_UNIQUE_ID
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import config_validation as cv
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,10 +35,8 @@ DEFAULT_SUPPORTS_ON = True
 
 DOMAIN = "kef"
 
-SCAN_INTERVAL = timedelta(seconds=15)
-
-SOURCES = {"LSX": ["Wifi", "Bluetooth", "Aux", "Opt"]}
-SOURCES["LS50"] = SOURCES["LSX"] + ["Usb"]
+SOURCES = {"LSX": ("Wifi", "Bluetooth", "Aux", "Opt")}
+SOURCES["LS50"] = SOURCES["LSX"] + ("Usb",)
 
 CONF_MAX_VOLUME = "maximum_volume"
 CONF_VOLUME_STEP = "volume_step"
@@ -46,6 +45,54 @@ CONF_INVERSE_SPEAKER_MODE = "inverse_speaker_mode"
 CONF_SUPPORTS_ON = "supports_on"
 CONF_STANDBY_TIME = "standby_time"
 
+_BASE_FEATURES = (
+    MediaPlayerEntityFeature.VOLUME_SET
+    | MediaPlayerEntityFeature.VOLUME_STEP
+    | MediaPlayerEntityFeature.VOLUME_MUTE
+    | MediaPlayerEntityFeature.SELECT_SOURCE
+    | MediaPlayerEntityFeature.TURN_OFF
+    | MediaPlayerEntityFeature.NEXT_TRACK  # only in Bluetooth and Wifi
+    | MediaPlayerEntityFeature.PAUSE  # only in Bluetooth and Wifi
+    | MediaPlayerEntityFeature.PLAY  # only in Bluetooth and Wifi
+    | MediaPlayerEntityFeature.PREVIOUS_TRACK  # only in Bluetooth and Wifi
+)
+_FEATURES_WITH_ON = _BASE_FEATURES | MediaPlayerEntityFeature.TURN_ON
+
+_PLAY_STATE_MAP = {
+    "Playing": MediaPlayerState.PLAYING,
+    "Paused": MediaPlayerState.PAUSED,
+    "Stopped": MediaPlayerState.IDLE,  # transport stopped but powered
+}
+
+SERVICE_MODE = "set_mode"
+SERVICE_SET_DSP = "set_dsp"
+SERVICE_UPDATE_DSP = "update_dsp"
+
+# {DSP setting: service field}, each exposed as a `set_<setting>` service
+_DSP_SETTERS = {
+    "desk_db": "db_value",
+    "wall_db": "db_value",
+    "treble_db": "db_value",
+    "high_hz": "hz_value",
+    "low_hz": "hz_value",
+    "sub_db": "db_value",
+}
+
+
+def _dsp_validator(which: str) -> vol.All:
+    options = DSP_OPTION_MAPPING[which]
+    dtype = type(options[0])  # int or float
+    return vol.All(vol.Coerce(float), vol.Coerce(dtype), vol.In(options))
+
+
+_DSP_SCHEMAS = {
+    which: {vol.Required(option): _dsp_validator(which)}
+    for which, option in _DSP_SETTERS.items()
+}
+_DSP_BATCH_SCHEMA = {
+    vol.Optional(which): _dsp_validator(which) for which in _DSP_SETTERS
+}
+
 PLATFORM_SCHEMA = MEDIA_PLAYER_PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_HOST): cv.string,
@@ -107,160 +154,170 @@ async def async_setup_platform(
         sources,
     )
 
-    media_player = KefMediaPlayer(
-        name,
-        host,
-        port,
-        maximum_volume,
-        volume_step,
-        use_custom_volume_ladder,
-        standby_time,
-        inverse_speaker_mode,
-        supports_on,
-        sources,
-        speaker_type,
-        loop=hass.loop,
-        unique_id=unique_id,
-    )
-
     if host in hass.data[DOMAIN]:
         _LOGGER.debug("%s is already configured", host)
     else:
+        speaker = AsyncKefSpeaker(
+            host,
+            port,
+            volume_step=volume_step,
+            maximum_volume=maximum_volume,
+            standby_time=standby_time,
+            inverse_speaker_mode=inverse_speaker_mode,
+            use_custom_volume_ladder=use_custom_volume_ladder,
+            loop=hass.loop,
+        )
+        coordinator = KefDataUpdateCoordinator(hass, speaker, name)
+        await coordinator.async_refresh()
+
+        media_player = KefMediaPlayer(
+            coordinator,
+            name,
+            supports_on,
+            sources,
+            speaker_type,
+            unique_id=unique_id,
+        )
         hass.data[DOMAIN][host] = media_player
-        async_add_entities([media_player], update_before_add=True)
+        async_add_entities([media_player])
+
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_MODE,
+        {
+            vol.Optional("desk_mode"): cv.boolean,
+            vol.Optional("wall_mode"): cv.boolean,
+            vol.Optional("phase_correction"): cv.boolean,
+            vol.Optional("high_pass"): cv.boolean,
+            vol.Optional("sub_polarity"): vol.In(["-", "+"]),
+            vol.Optional("bass_extension"): vol.In(["Less", "Standard", "Extra"]),
+        },
+        "set_mode",
+    )
+    platform.async_register_entity_service(SERVICE_UPDATE_DSP, None, "update_dsp")
+    platform.async_register_entity_service(
+        SERVICE_SET_DSP, _DSP_BATCH_SCHEMA, "set_dsp"
+    )
+
+    for which, option in _DSP_SETTERS.items():
+        platform.async_register_entity_service(
+            f"set_{which}",
+            _DSP_SCHEMAS[which],
+            partial(_async_set_dsp_service, which, option),
+        )
+
+
+async def _async_set_dsp_service(
+    which: str, option: str, entity: KefMediaPlayer, call: ServiceCall
+) -> None:
+    """Handle any of the `set_<setting>` DSP services."""
+    await entity._async_set_dsp_value(which, call.data[option])
 
 
-class KefMediaPlayer(MediaPlayerEntity):
+class KefMediaPlayer(
+    CoordinatorEntity[KefDataUpdateCoordinator], MediaPlayerEntity
+):
     """Kef Player Object."""
 
     _attr_icon = "mdi:speaker"
 
     def __init__(
         self,
+        coordinator,
         name,
-        host,
-        port,
-        maximum_volume,
-        volume_step,
-        use_custom_volume_ladder,
-        standby_time,
-        inverse_speaker_mode,
         supports_on,
         sources,
         speaker_type,
-        loop,
         unique_id,
     ):
         """Initialize the media player."""
+        super().__init__(coordinator)
         self._attr_name = name
         self._attr_source_list = sources
-        self._speaker = AsyncKefSpeaker(
-            host,
-            port,
-            volume_step=volume_step,
-            maximum_volume=maximum_volume,
-            standby_time=standby_time,
-            inverse_speaker_mode=inverse_speaker_mode,
-            use_custom_volume_ladder=use_custom_volume_ladder,
-            loop=loop,
-        )
+        self._source_set = frozenset(sources)
+        self._speaker = coordinator.speaker
         self._attr_unique_id = unique_id
         self._supports_on = supports_on
         self._speaker_type = speaker_type
 
-        self._attr_available = False
-
         self._play_state: str | None = None
+        self._dsp: dict | None = None
 
         self._attr_supported_features = (
-            MediaPlayerEntityFeature.VOLUME_SET
-            | MediaPlayerEntityFeature.VOLUME_STEP
-            | MediaPlayerEntityFeature.VOLUME_MUTE
-            | MediaPlayerEntityFeature.SELECT_SOURCE
-            | MediaPlayerEntityFeature.TURN_OFF
-            | MediaPlayerEntityFeature.NEXT_TRACK  # only in Bluetooth and Wifi
-            | MediaPlayerEntityFeature.PAUSE  # only in Bluetooth and Wifi
-            | MediaPlayerEntityFeature.PLAY  # only in Bluetooth and Wifi
-            | MediaPlayerEntityFeature.PREVIOUS_TRACK  # only in Bluetooth and Wifi
+            _FEATURES_WITH_ON if supports_on else _BASE_FEATURES
         )
-        if supports_on:
-            self._attr_supported_features |= MediaPlayerEntityFeature.TURN_ON
-
-    async def async_update(self) -> None:
-        """Update latest state."""
-        _LOGGER.debug("Running async_update")
-        try:
-            # Try to see if we can talk to the speaker at all
-            self._attr_available = await self._speaker.is_online()
-
-            if self.available:
-                status = await self._speaker.get_full_status()
-
-                # Volume + source from the speaker object
-                self._attr_is_volume_muted = self._speaker.is_muted
-                self._attr_volume_level = self._speaker.volume
-                self._attr_source = status["source"]
-
-                # Cache play state (Wifi / Bluetooth only, per get_full_status)
-                self._play_state = status.get("play_state")
-
-                if not status["is_on"]:
-                    # Fully off / standby
-                    self._attr_state = MediaPlayerState.OFF
-                else:
-                    # Speaker is powered; refine based on play state
-                    if self._play_state == "Playing":
-                        self._attr_state = MediaPlayerState.PLAYING
-                    elif self._play_state == "Paused":
-                        self._attr_state = MediaPlayerState.PAUSED
-                    elif self._play_state == "Stopped":
-                        # Transport stopped but powered
-                        self._attr_state = MediaPlayerState.IDLE
-                    else:
-                        # Fallback if we couldn't read play state
-                        self._attr_state = MediaPlayerState.ON
-
-                # No DSP calls here – keeps things snappy
-
-            else:
-                # We couldn't reach the speaker at all
-                self._attr_is_volume_muted = None
-                self._attr_source = None
-                self._attr_volume_level = None
-                self._attr_state = MediaPlayerState.OFF
-                self._play_state = None
-
-        except (ConnectionError, TimeoutError, RetryError, OSError) as err:
-            # Anything ugly from aiokef / tenacity → just mark it unavailable
-            _LOGGER.debug("Error in `update`: %s", err)
-            self._attr_available = False
+        self._update_from_status()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_status()
+        super()._handle_coordinator_update()
+
+    def _update_from_status(self) -> None:
+        """Update latest state from the coordinator data."""
+        status = self.coordinator.data
+        if not self.coordinator.last_update_success or status is None:
             self._attr_is_volume_muted = None
             self._attr_source = None
             self._attr_volume_level = None
             self._attr_state = MediaPlayerState.OFF
             self._play_state = None
+            return
+
+        # Volume + source from the speaker object
+        self._attr_is_volume_muted = self._speaker.is_muted
+        self._attr_volume_level = self._speaker.volume
+        self._attr_source = status["source"]
+
+        # Cache play state (Wifi / Bluetooth only, per get_full_status)
+        self._play_state = status.get("play_state")
+
+        if not status["is_on"]:
+            # Fully off / standby
+            self._attr_state = MediaPlayerState.OFF
+        else:
+            # Speaker is powered; refine based on play state, falling back to
+            # ON if we couldn't read it
+            self._attr_state = _PLAY_STATE_MAP.get(
+                self._play_state, MediaPlayerState.ON
+            )
+
+        # No DSP calls here – keeps things snappy
+
+    async def _async_after_command(self) -> None:
+        """Show the cached volume/mute right away, then refresh the rest."""
+        self._attr_volume_level = self._speaker.volume
+        self._attr_is_volume_muted = self._speaker.is_muted
+        self.async_write_ha_state()
+        await self.coordinator.async_wake()
 
     async def async_turn_off(self) -> None:
         """Turn the media player off."""
         await self._speaker.turn_off()
+        await self._async_after_command()
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
         if not self._supports_on:
             raise NotImplementedError
         await self._speaker.turn_on()
+        await self._async_after_command()
 
     async def async_volume_up(self) -> None:
         """Volume up the media player."""
         await self._speaker.increase_volume()
+        await self._async_after_command()
 
     async def async_volume_down(self) -> None:
         """Volume down the media player."""
         await self._speaker.decrease_volume()
+        await self._async_after_command()
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
         await self._speaker.set_volume(volume)
+        await self._async_after_command()
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute (True) or unmute (False) media player."""
@@ -268,39 +325,121 @@ class KefMediaPlayer(MediaPlayerEntity):
             await self._speaker.mute()
         else:
             await self._speaker.unmute()
+        await self._async_after_command()
 
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
-        if self.source_list is not None and source in self.source_list:
+        if source in self._source_set:
             await self._speaker.set_source(source)
-
-            # After switching to Wifi/Bluetooth, do a one-shot play state read
-            if source in ("Wifi", "Bluetooth"):
-                status = await self._speaker.get_full_status()
-                self._play_state = status.get("play_state")
+            # The refresh also reads the play state for Wifi/Bluetooth
+            await self._async_after_command()
         else:
             raise ValueError(f"Unknown input source: {source}.")
 
     async def async_media_play(self) -> None:
         """Send play command."""
         await self._speaker.set_play_pause()
+        await self._async_after_command()
 
     async def async_media_pause(self) -> None:
         """Send pause command."""
         await self._speaker.set_play_pause()
+        await self._async_after_command()
 
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
         await self._speaker.prev_track()
+        await self._async_after_command()
 
     async def async_media_next_track(self) -> None:
         """Send next track command."""
         await self._speaker.next_track()
+        await self._async_after_command()
+
+    async def update_dsp(self) -> None:
+        """Update the DSP settings."""
+        if self._speaker_type == "LS50" and self.state == MediaPlayerState.OFF:
+            # The LSX is able to respond when off the LS50 has to be on.
+            return
+
+        # Fire all reads together; the speaker connection serialises them.
+        mode, desk_db, wall_db, treble_db, high_hz, low_hz, sub_db = (
+            await asyncio.gather(
+                self._speaker.get_mode(),
+                self._speaker.get_desk_db(),
+                self._speaker.get_wall_db(),
+                self._speaker.get_treble_db(),
+                self._speaker.get_high_hz(),
+                self._speaker.get_low_hz(),
+                self._speaker.get_sub_db(),
+            )
+        )
+        self._dsp = {
+            "desk_db": desk_db,
+            "wall_db": wall_db,
+            "treble_db": treble_db,
+            "high_hz": high_hz,
+            "low_hz": low_hz,
+            "sub_db": sub_db,
+            **mode._asdict(),
+        }
+        self.async_write_ha_state()
+
+    async def set_mode(
+        self,
+        desk_mode=None,
+        wall_mode=None,
+        phase_correction=None,
+        high_pass=None,
+        sub_polarity=None,
+        bass_extension=None,
+    ):
+        """Set the speaker mode."""
+        new_mode = await self._speaker.set_mode(
+            desk_mode=desk_mode,
+            wall_mode=wall_mode,
+            phase_correction=phase_correction,
+            high_pass=high_pass,
+            sub_polarity=sub_polarity,
+            bass_extension=bass_extension,
+        )
+        # Patch the cached DSP values instead of dropping them
+        if self._dsp is not None:
+            self._dsp.update(new_mode._asdict())
+            self.async_write_ha_state()
+
+    async def _async_set_dsp_value(self, which: str, value) -> None:
+        """Set a single DSP setting (e.g. "desk_db") of the KEF speakers."""
+        await getattr(self._speaker, f"set_{which}")(value)
+        if self._dsp is not None:
+            self._dsp[which] = value
+            self.async_write_ha_state()
+
+    async def set_dsp(self, **values) -> None:
+        """Set several DSP settings (e.g. desk_db=-1.0, sub_db=2) in one go."""
+        results = await asyncio.gather(
+            *(
+                getattr(self._speaker, f"set_{which}")(value)
+                for which, value in values.items()
+            ),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        # Keep the cache in line with whatever did reach the speaker
+        if self._dsp is not None:
+            self._dsp.update(
+                (which, value)
+                for (which, value), result in zip(values.items(), results)
+                if not isinstance(result, BaseException)
+            )
+            self.async_write_ha_state()
+        if errors:
+            raise errors[0]
 
     @property
     def extra_state_attributes(self):
         """Return extra info about the KEF device."""
-        attrs = {}
+        attrs = dict(self._dsp or {})
         if self._play_state is not None:
             attrs["play_state"] = self._play_state
         return attrs